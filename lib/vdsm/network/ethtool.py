@@ -21,7 +21,9 @@ from __future__ import absolute_import
 from __future__ import division
 
 import array
+import errno
 import fcntl
+import os
 import socket
 import struct
 from contextlib import closing
@@ -33,6 +35,38 @@ SIOCETHTOOL = 0x8946  # Ethtool interface
 DRVINFO_FORMAT = '= I 32s 32s 32s 32s 32s 12s 5I'
 IFREQ_FORMAT = '16sPi'  # device_name, buffer_pointer, buffer_len
 
+# Generic netlink, see linux/netlink.h, linux/genetlink.h and
+# linux/ethtool_netlink.h
+NETLINK_GENERIC = 16
+NLMSG_ERROR = 0x2
+NLM_F_REQUEST = 0x1
+NLA_F_NESTED = 0x8000
+NLA_TYPE_MASK = 0x3FFF  # strips the NLA_F_NESTED and NLA_F_NET_BYTEORDER
+GENL_ID_CTRL = 0x10
+CTRL_CMD_GETFAMILY = 3
+CTRL_ATTR_FAMILY_ID = 1
+CTRL_ATTR_FAMILY_NAME = 2
+ETHTOOL_GENL_NAME = 'ethtool'
+ETHTOOL_GENL_VERSION = 1
+ETHTOOL_MSG_LINKMODES_GET = 4
+ETHTOOL_A_LINKMODES_HEADER = 1
+ETHTOOL_A_LINKMODES_SPEED = 5
+ETHTOOL_A_HEADER_DEV_NAME = 2
+ETHTOOL_A_HEADER_FLAGS = 3
+ETHTOOL_FLAG_COMPACT_BITSETS = 1 << 0
+NLMSGHDR_FORMAT = '=IHHII'  # length, type, flags, sequence, port_id
+GENLMSGHDR_FORMAT = '=BBH'  # command, version, reserved
+NLATTR_FORMAT = '=HH'  # length, type
+_NLMSGHDR_LEN = struct.calcsize(NLMSGHDR_FORMAT)
+_GENLMSGHDR_LEN = struct.calcsize(GENLMSGHDR_FORMAT)
+_NLATTR_LEN = struct.calcsize(NLATTR_FORMAT)
+_NL_RECV_BUFF_SIZE = 1024 * 64
+_NL_SOCKET_BUFF_SIZE = 1024 * 512
+_NL_TIMEOUT = 2  # seconds
+# Bounds the replies queued by the kernel before they are read, so they fit in
+# the socket receive buffer.
+_NL_REQUESTS_WINDOW = 32
+
 
 def driver_name(device_name):
     """Returns the driver used by a device.
@@ -66,3 +100,171 @@ def driver_name(device_name):
     ) = struct.unpack(DRVINFO_FORMAT, buff)
     driver_str = py2to3.to_str(driver)
     return driver_str.rstrip('\0')  # C string end with the leftmost null char
+
+
+def link_speeds(device_names):
+    """Returns a dict of device name to its raw link speed (Mbps) as reported
+    by the kernel, for the passed devices which support it.
+
+    The devices are queried on a single netlink socket, sending one ethtool
+    netlink request per device in bounded batches. Requires the kernel ethtool
+    netlink interface (kernel 5.6 and above).
+
+    Throws OSError ENOENT if the kernel lacks the ethtool netlink family.
+    Throws socket.timeout if the kernel does not reply in time.
+    """
+    if not device_names:
+        return {}
+    if _family_ids.get(ETHTOOL_GENL_NAME, 0) is None:
+        raise _missing_family_error(ETHTOOL_GENL_NAME)
+
+    with closing(
+        socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_GENERIC)
+    ) as sock:
+        sock.setsockopt(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, _NL_SOCKET_BUFF_SIZE
+        )
+        sock.settimeout(_NL_TIMEOUT)
+        sock.bind((0, 0))
+        family_id = _genl_family_id(sock, ETHTOOL_GENL_NAME)
+        requests = list(enumerate(device_names, 1))
+        speeds = {}
+        for i in range(0, len(requests), _NL_REQUESTS_WINDOW):
+            window = dict(requests[i : i + _NL_REQUESTS_WINDOW])
+            sock.sendall(
+                b''.join(
+                    _linkmodes_get_msg(family_id, seq, device_name)
+                    for seq, device_name in window.items()
+                )
+            )
+            for seq, attrs in _genl_replies(sock, window, ignore_errors=True):
+                speed = attrs.get(ETHTOOL_A_LINKMODES_SPEED)
+                if speed is not None:
+                    (speeds[window[seq]],) = struct.unpack('=I', speed)
+        return speeds
+
+
+def _linkmodes_get_msg(family_id, seq, device_name):
+    # Compact bitsets keep the link modes of each reply small
+    header = _nla_pack(
+        ETHTOOL_A_HEADER_DEV_NAME, _nla_strz(device_name)
+    ) + _nla_pack(
+        ETHTOOL_A_HEADER_FLAGS,
+        struct.pack('=I', ETHTOOL_FLAG_COMPACT_BITSETS),
+    )
+    return _genl_msg(
+        family_id,
+        ETHTOOL_MSG_LINKMODES_GET,
+        ETHTOOL_GENL_VERSION,
+        seq,
+        _nla_pack(ETHTOOL_A_LINKMODES_HEADER | NLA_F_NESTED, header),
+    )
+
+
+# Generic netlink family name to its (kernel lifetime) id, None for a family
+# missing from the kernel.
+_family_ids = {}
+
+
+def _genl_family_id(sock, family_name):
+    """Returns the id of a generic netlink family.
+
+    Throws OSError ENOENT if the kernel lacks the family.
+    """
+    if family_name not in _family_ids:
+        seq = 0
+        sock.sendall(
+            _genl_msg(
+                GENL_ID_CTRL,
+                CTRL_CMD_GETFAMILY,
+                1,
+                seq,
+                _nla_pack(CTRL_ATTR_FAMILY_NAME, _nla_strz(family_name)),
+            )
+        )
+        try:
+            for _, attrs in _genl_replies(sock, (seq,)):
+                (_family_ids[family_name],) = struct.unpack(
+                    '=H', attrs[CTRL_ATTR_FAMILY_ID][:2]
+                )
+        except OSError as e:
+            if e.errno == errno.ENOENT:
+                _family_ids[family_name] = None
+            raise
+    family_id = _family_ids[family_name]
+    if family_id is None:
+        raise _missing_family_error(family_name)
+    return family_id
+
+
+def _missing_family_error(family_name):
+    return OSError(
+        errno.ENOENT, 'Generic netlink family %s is missing' % family_name
+    )
+
+
+def _genl_msg(msg_type, cmd, version, seq, payload):
+    length = _NLMSGHDR_LEN + _GENLMSGHDR_LEN + len(payload)
+    return (
+        struct.pack(NLMSGHDR_FORMAT, length, msg_type, NLM_F_REQUEST, seq, 0)
+        + struct.pack(GENLMSGHDR_FORMAT, cmd, version, 0)
+        + payload
+    )
+
+
+def _genl_replies(sock, seqs, ignore_errors=False):
+    """Yields the sequence and attributes of the generic netlink reply to each
+    of the passed request sequences.
+
+    Throws OSError on an error reply, unless ignore_errors is set in which
+    case the failed request is skipped.
+    """
+    pending = set(seqs)
+    while pending:
+        data = sock.recv(_NL_RECV_BUFF_SIZE)
+        offset = 0
+        while offset + _NLMSGHDR_LEN <= len(data):
+            msg_len, msg_type, _, seq, _ = struct.unpack_from(
+                NLMSGHDR_FORMAT, data, offset
+            )
+            if msg_len < _NLMSGHDR_LEN:
+                raise OSError(errno.EBADMSG, 'Truncated netlink message')
+            body = data[offset + _NLMSGHDR_LEN : offset + msg_len]
+            offset += _align(msg_len)
+            if seq not in pending:
+                continue
+            pending.discard(seq)
+            if msg_type == NLMSG_ERROR:
+                (error,) = struct.unpack_from('=i', body)
+                if error and not ignore_errors:
+                    raise OSError(-error, os.strerror(-error))
+                continue
+            yield seq, _nla_parse(body[_GENLMSGHDR_LEN:])
+
+
+def _nla_pack(attr_type, value):
+    length = _NLATTR_LEN + len(value)
+    padding = b'\0' * (_align(length) - length)
+    return struct.pack(NLATTR_FORMAT, length, attr_type) + value + padding
+
+
+def _nla_parse(data):
+    attrs = {}
+    offset = 0
+    while offset + _NLATTR_LEN <= len(data):
+        length, attr_type = struct.unpack_from(NLATTR_FORMAT, data, offset)
+        if length < _NLATTR_LEN:
+            break
+        attrs[attr_type & NLA_TYPE_MASK] = data[
+            offset + _NLATTR_LEN : offset + length
+        ]
+        offset += _align(length)
+    return attrs
+
+
+def _nla_strz(value):
+    return py2to3.to_binary(value) + b'\0'
+
+
+def _align(length):
+    return (length + 3) & ~3
@@ -369,6 +369,13 @@ def prefix2netmask(prefix):
             '%s is not a valid prefix value. It must be between '
             '0 and 32' % prefix
         )
+    return _NETMASKS[prefix]
+
+
+def _compute_netmask(prefix):
     return socket.inet_ntoa(
         struct.pack("!I", int('1' * prefix + '0' * (32 - prefix), 2))
     )
+
+
+_NETMASKS = tuple(_compute_netmask(prefix) for prefix in range(33))
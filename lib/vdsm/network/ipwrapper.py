@@ -25,6 +25,7 @@ from glob import iglob
 import errno
 import itertools
 import os
+import tempfile
 
 import six
 
@@ -663,6 +664,19 @@ def addrAdd(dev, ipaddr, netmask, family=4):
     _exec_cmd(command)
 
 
+def addrAddMany(dev, addrs):
+    """
+    Add several addresses to a device using a single ip invocation.
+    :param addrs: Iterable of (ipaddr, netmask) tuples, the address family is
+                  deduced by ip from each address.
+    """
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.ipbatch') as batch:
+        for ipaddr, netmask in addrs:
+            batch.write('addr add dev %s %s/%s\n' % (dev, ipaddr, netmask))
+        batch.flush()
+        _exec_cmd([_IP_BINARY.cmd, '-batch', batch.name])
+
+
 def addrDel(dev, ipaddr, netmask, family):
     command = [
         _IP_BINARY.cmd,
@@ -42,7 +42,7 @@ def speed(bond_name):
                 active_slave = opts['active_slave']
                 s = nic.speed(active_slave[0]) if active_slave else 0
             elif opts['mode'][1] in BONDING_LOADBALANCE_MODES:
-                s = sum(nic.speed(slave) for slave in opts['slaves'])
+                s = sum(nic.speed_bulk(opts['slaves']).values())
             return s
     except Exception:
         logging.exception('cannot read %s speed', bond_name)
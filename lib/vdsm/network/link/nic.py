@@ -20,9 +20,11 @@
 from __future__ import absolute_import
 from __future__ import division
 
+import errno
 import io
 import logging
 
+from vdsm.network import ethtool
 from vdsm.network.link import dpdk
 from vdsm.network.link.iface import iface
 
@@ -33,20 +35,76 @@ class ReadSpeedValueError(Exception):
 
 def speed(nic_name):
     """Return the nic speed if it is a legal value, 0 otherwise."""
-    interface = iface(nic_name)
-    if interface.is_oper_up():
-        if dpdk.is_dpdk(nic_name):
-            return dpdk.speed(nic_name)
+    return speed_bulk([nic_name])[nic_name]
+
+
+def speed_bulk(nic_names):
+    """
+    Return a dict of the nics speed, reporting 0 for a nic with no legal speed
+    value.
+    The speed of all the (non DPDK) nics is read with a single ethtool netlink
+    query, falling back to sysfs when the kernel does not support it.
+    """
+    speeds = {}
+    queried_nics = []
+    for nic_name in nic_names:
+        if not iface(nic_name).is_oper_up():
+            speeds[nic_name] = 0
+        elif dpdk.is_dpdk(nic_name):
+            speeds[nic_name] = dpdk.speed(nic_name)
+        else:
+            queried_nics.append(nic_name)
+
+    if queried_nics:
         try:
-            return read_speed_using_sysfs(nic_name)
-        except Exception:
-            logging.debug('cannot read %s speed', nic_name)
-    return 0
+            raw_speeds = _ethtool_nl_query(queried_nics)
+        except Exception as e:
+            # A kernel lacking ethtool netlink is expected, not worth a trace
+            if getattr(e, 'errno', None) != errno.ENOENT:
+                logging.debug(
+                    'cannot query nics speed using ethtool netlink',
+                    exc_info=True,
+                )
+            speeds.update(
+                (nic_name, _read_speed_using_sysfs_or_zero(nic_name))
+                for nic_name in queried_nics
+            )
+        else:
+            speeds.update(
+                (nic_name, _valid_speed_or_zero(nic_name, raw_speeds))
+                for nic_name in queried_nics
+            )
+    return speeds
+
+
+def _ethtool_nl_query(nic_names):
+    """Return a dict of the raw speed values of the queried nics"""
+    return ethtool.link_speeds(nic_names)
+
+
+def _valid_speed_or_zero(nic_name, raw_speeds):
+    try:
+        return _validate_speed(raw_speeds[nic_name])
+    except (KeyError, ReadSpeedValueError):
+        logging.debug('cannot read %s speed', nic_name)
+        return 0
+
+
+def _read_speed_using_sysfs_or_zero(nic_name):
+    try:
+        return read_speed_using_sysfs(nic_name)
+    except Exception:
+        logging.debug('cannot read %s speed', nic_name)
+        return 0
 
 
 def read_speed_using_sysfs(nic_name):
     with io.open('/sys/class/net/%s/speed' % nic_name) as f:
         s = int(f.read())
+    return _validate_speed(s)
+
+
+def _validate_speed(s):
     # the device may have been disabled/downed after checking
     # so we validate the return value as sysfs may return
     # special values to indicate the device is down/disabled
@@ -27,6 +27,7 @@ import logging
 import six
 
 from vdsm.network import dns
+from vdsm.network import netlink
 from vdsm.network import nmstate
 from vdsm.network.ip import dhclient
 from vdsm.network.ip.address import ipv6_supported
@@ -60,10 +61,12 @@ def _get(vdsmnets=None):
     retrieving data from the running config.
     :return: Dict of networking devices with all their details.
     """
-    ipaddrs = getIpAddrs()
-    routes = get_routes()
+    # All the netlink queries of the report share a single pool socket.
+    with netlink.pooled_socket():
+        ipaddrs = getIpAddrs()
+        routes = get_routes()
 
-    devices_info = _devices_report(ipaddrs, routes)
+        devices_info = _devices_report(ipaddrs, routes)
     nets_info = _networks_report(vdsmnets, routes, ipaddrs, devices_info)
 
     add_qos_info_to_devices(nets_info, devices_info)
@@ -43,16 +43,22 @@ def ifcfg_config(ifcfg_file):
     ifaceCfg = {}
     try:
         with open(ifcfg_file) as f:
-            for line in shlex.split(f, comments=True):
-                k, v = line.split('=', 1)
-                if k in _IFCFG_ZERO_SUFFIXED:
-                    k = k[:-1]
-                ifaceCfg[k] = v
+            data = f.read()
+        ifaceCfg.update(
+            _ifcfg_entry(line) for line in shlex.split(data, comments=True)
+        )
     except:
         logging.exception('error reading ifcfg file {}'.format(ifcfg_file))
     return ifaceCfg
 
 
+def _ifcfg_entry(line):
+    k, v = line.split('=', 1)
+    if k in _IFCFG_ZERO_SUFFIXED:
+        k = k[:-1]
+    return k, v
+
+
 def visible_devs(predicate):
     """Returns a list of visible (vdsm manageable) links for which the
     predicate is True"""
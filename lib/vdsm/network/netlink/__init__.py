@@ -73,6 +73,13 @@ class NLSocketPool(object):
 _pool = NLSocketPool(_POOL_SIZE)
 
 
+def pooled_socket():
+    """Returns a context manager holding a pool socket for the current thread.
+    All the netlink queries of the thread issued within the context reuse the
+    held socket."""
+    return _pool.socket()
+
+
 def _open_socket(callback_function=None, callback_arg=None):
     """Returns an open netlink socket.
         callback_function: Modify the callback handler associated with the
@@ -82,6 +82,30 @@ def waitfor_ipv6_addr(iface, address=None, timeout=10):
         yield
 
 
+@contextmanager
+def waitfor_addrs(iface, addresses, timeout=10):
+    """
+    Silently block until global scope address messages for all the expected
+    addresses are detected from the kernel (through netlink). Both ipv4 and
+    ipv6 addresses are watched using a single monitor.
+    :param iface: The device name.
+    :param addresses: Iterable of CIDR addresses expected - <address/bitmask>
+                      Note that for a full mask(32) ipv4 address, no mask is
+                      specified
+    :param timeout: The maximum time in seconds to wait for the messages.
+    """
+    expected_event = {'label': iface, 'event': 'new_addr', 'scope': 'global'}
+    groups = ('ipv4-ifaddr', 'ipv6-ifaddr')
+    pending = set(addresses)
+
+    def check_event(event):
+        pending.discard(event.get('address'))
+        return not pending
+
+    with wait_for_event(iface, expected_event, groups, timeout, check_event):
+        yield
+
+
 @contextmanager
 def waitfor_link_exists(iface, timeout=0.5):
     """
@@ -532,9 +532,11 @@ def netinfo(vdsmnets=None, compatibility=None):
 def _add_speed_device_info(net_caps):
     """Collect and include device speed information in the report."""
     timeout = 2
-    for devname, devattr in six.viewitems(net_caps['nics']):
+    for devname in net_caps['nics']:
         timeout -= _wait_for_link_up(devname, timeout)
-        devattr['speed'] = nic.speed(devname)
+    nics_speed = nic.speed_bulk(net_caps['nics'])
+    for devname, devattr in six.viewitems(net_caps['nics']):
+        devattr['speed'] = nics_speed[devname]
 
     for devname, devattr in six.viewitems(net_caps['bondings']):
         timeout -= _wait_for_link_up(devname, timeout)
@@ -21,10 +21,13 @@
 from __future__ import absolute_import
 from __future__ import division
 
+import errno
 import unittest
 
 from vdsm.network import ethtool
+from vdsm.network.link.iface import iface
 
+from ..nettestlib import veth_pair
 from .netintegtestlib import bridge_device
 
 
@@ -32,3 +35,18 @@ class TestEthtoolDeviceInfo(unittest.TestCase):
     def test_detect_device_driver(self):
         with bridge_device() as br:
             self.assertEqual('bridge', ethtool.driver_name(br.devName))
+
+    def test_link_speeds_match_sysfs(self):
+        with veth_pair() as (left, right):
+            iface(left).up()
+            iface(right).up()
+            with open('/sys/class/net/%s/speed' % left) as f:
+                sysfs_speed = int(f.read())
+            try:
+                speeds = ethtool.link_speeds([left, right, 'no_such_dev'])
+            except OSError as e:
+                if e.errno != errno.ENOENT:
+                    raise
+                self.skipTest('Kernel lacks ethtool netlink support')
+            self.assertEqual(sysfs_speed, speeds[left])
+            self.assertNotIn('no_such_dev', speeds)
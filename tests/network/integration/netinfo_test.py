@@ -148,18 +148,23 @@ class TestNetinfo(object):
     @ipv6_broken_on_travis_ci
     def test_ip_info(self):
         with dummy_device() as device:
-            with waitfor.waitfor_ipv4_addr(device, address=IPV4_ADDR1_CIDR):
-                ipwrapper.addrAdd(device, IPV4_ADDR1, IPV4_PREFIX_LENGTH)
-            with waitfor.waitfor_ipv4_addr(device, address=IPV4_ADDR2_CIDR):
-                ipwrapper.addrAdd(device, IPV4_ADDR2, IPV4_PREFIX_LENGTH)
-            with waitfor.waitfor_ipv6_addr(device, address=IPV6_ADDR_CIDR):
-                ipwrapper.addrAdd(
-                    device, IPV6_ADDR, IPV6_PREFIX_LENGTH, family=6
-                )
-
             # 32 bit addresses are reported slashless by netlink
-            with waitfor.waitfor_ipv4_addr(device, address=IPV4_ADDR3):
-                ipwrapper.addrAdd(device, IPV4_ADDR3, 32)
+            expected_addrs = (
+                IPV4_ADDR1_CIDR,
+                IPV4_ADDR2_CIDR,
+                IPV6_ADDR_CIDR,
+                IPV4_ADDR3,
+            )
+            with waitfor.waitfor_addrs(device, expected_addrs):
+                ipwrapper.addrAddMany(
+                    device,
+                    (
+                        (IPV4_ADDR1, IPV4_PREFIX_LENGTH),
+                        (IPV4_ADDR2, IPV4_PREFIX_LENGTH),
+                        (IPV6_ADDR, IPV6_PREFIX_LENGTH),
+                        (IPV4_ADDR3, 32),
+                    ),
+                )
 
             assert addresses.getIpInfo(device) == (
                 IPV4_ADDR1,
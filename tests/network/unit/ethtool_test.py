@@ -0,0 +1,113 @@
+#
+# Copyright 2020 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA
+#
+# Refer to the README and COPYING files for full details of the license
+#
+
+from __future__ import absolute_import
+from __future__ import division
+
+import errno
+import struct
+
+import pytest
+
+from vdsm.network import ethtool
+
+FAMILY_ID = 0x1C
+SPEED = 1000
+
+
+class FakeNetlinkSocket(object):
+    def __init__(self, *chunks):
+        self._chunks = list(chunks)
+
+    def recv(self, bufsize):
+        return self._chunks.pop(0)
+
+
+def _nlmsg(msg_type, seq, body):
+    length = struct.calcsize(ethtool.NLMSGHDR_FORMAT) + len(body)
+    header = struct.pack(ethtool.NLMSGHDR_FORMAT, length, msg_type, 0, seq, 0)
+    return header + body + b'\0' * (ethtool._align(length) - length)
+
+
+def _speed_reply(seq, speed=SPEED):
+    attrs = ethtool._nla_pack(
+        ethtool.ETHTOOL_A_LINKMODES_SPEED, struct.pack('=I', speed)
+    )
+    genl_header = struct.pack(
+        ethtool.GENLMSGHDR_FORMAT, ethtool.ETHTOOL_MSG_LINKMODES_GET, 1, 0
+    )
+    return _nlmsg(FAMILY_ID, seq, genl_header + attrs)
+
+
+def _error_reply(seq, error):
+    return _nlmsg(ethtool.NLMSG_ERROR, seq, struct.pack('=i', -error))
+
+
+class TestGenericNetlink(object):
+    def test_parse_nested_attribute(self):
+        nested = ethtool._nla_pack(
+            ethtool.ETHTOOL_A_HEADER_DEV_NAME, ethtool._nla_strz('eth0')
+        )
+        data = ethtool._nla_pack(
+            ethtool.ETHTOOL_A_LINKMODES_HEADER | ethtool.NLA_F_NESTED, nested
+        ) + ethtool._nla_pack(
+            ethtool.ETHTOOL_A_LINKMODES_SPEED, struct.pack('=I', SPEED)
+        )
+
+        attrs = ethtool._nla_parse(data)
+
+        assert set(attrs) == {
+            ethtool.ETHTOOL_A_LINKMODES_HEADER,
+            ethtool.ETHTOOL_A_LINKMODES_SPEED,
+        }
+        header = ethtool._nla_parse(attrs[ethtool.ETHTOOL_A_LINKMODES_HEADER])
+        assert header == {ethtool.ETHTOOL_A_HEADER_DEV_NAME: b'eth0\0'}
+
+    def test_replies_of_all_requests(self):
+        sock = FakeNetlinkSocket(_speed_reply(1), _speed_reply(2, 100))
+
+        replies = dict(ethtool._genl_replies(sock, (1, 2)))
+
+        speed_attr = ethtool.ETHTOOL_A_LINKMODES_SPEED
+        assert replies[1][speed_attr] == struct.pack('=I', SPEED)
+        assert replies[2][speed_attr] == struct.pack('=I', 100)
+
+    def test_reply_of_unknown_sequence_is_skipped(self):
+        sock = FakeNetlinkSocket(_speed_reply(7) + _speed_reply(1))
+
+        replies = list(ethtool._genl_replies(sock, (1,)))
+
+        assert [seq for seq, _ in replies] == [1]
+
+    def test_error_reply_raises(self):
+        sock = FakeNetlinkSocket(_error_reply(1, errno.ENOENT))
+
+        with pytest.raises(OSError) as e:
+            list(ethtool._genl_replies(sock, (1,)))
+        assert e.value.errno == errno.ENOENT
+
+    def test_error_reply_is_skipped_when_ignoring_errors(self):
+        sock = FakeNetlinkSocket(
+            _error_reply(1, errno.EOPNOTSUPP) + _speed_reply(2)
+        )
+
+        replies = list(ethtool._genl_replies(sock, (1, 2), ignore_errors=True))
+
+        assert [seq for seq, _ in replies] == [2]
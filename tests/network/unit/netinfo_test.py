@@ -50,35 +50,60 @@ class TestNetinfo(object):
     def test_netmask_conversions(self):
         path = os.path.join(os.path.dirname(__file__), "netmaskconversions")
         with open(path) as netmaskFile:
-            for line in netmaskFile:
-                if line.startswith('#'):
-                    continue
-                bitmask, address = [value.strip() for value in line.split()]
-                assert prefix2netmask(int(bitmask)) == address
+            lines = netmaskFile.read().splitlines()
+        conversions = (
+            line.split() for line in lines if not line.startswith('#')
+        )
+        for bitmask, address in conversions:
+            assert prefix2netmask(int(bitmask)) == address
         pytest.raises(ValueError, prefix2netmask, -1)
         pytest.raises(ValueError, prefix2netmask, 33)
 
     @mock.patch.object(nic, 'iface')
-    @mock.patch.object(nics.io, 'open')
-    def test_valid_nic_speed(self, mock_io_open, mock_iface):
+    @mock.patch.object(nic, '_ethtool_nl_query')
+    def test_valid_nic_speed(self, mock_nl_query, mock_iface):
         IS_UP = True
         values = (
-            (b'0', IS_UP, 0),
-            (b'-10', IS_UP, 0),
-            (six.b(str(2 ** 16 - 1)), IS_UP, 0),
-            (six.b(str(2 ** 32 - 1)), IS_UP, 0),
-            (b'123', IS_UP, 123),
-            (b'', IS_UP, 0),
-            (b'', not IS_UP, 0),
-            (b'123', not IS_UP, 0),
+            ({'fake_nic': 0}, IS_UP, 0),
+            ({'fake_nic': -10}, IS_UP, 0),
+            ({'fake_nic': 2 ** 16 - 1}, IS_UP, 0),
+            ({'fake_nic': 2 ** 32 - 1}, IS_UP, 0),
+            ({'fake_nic': 123}, IS_UP, 123),
+            ({}, IS_UP, 0),
+            ({}, not IS_UP, 0),
+            ({'fake_nic': 123}, not IS_UP, 0),
         )
 
         for passed, is_nic_up, expected in values:
-            mock_io_open.return_value = io.BytesIO(passed)
+            mock_nl_query.return_value = passed
             mock_iface.return_value.is_oper_up.return_value = is_nic_up
 
             assert nic.speed('fake_nic') == expected
 
+    @mock.patch.object(nic, 'iface')
+    @mock.patch.object(nic, '_ethtool_nl_query')
+    @mock.patch.object(nic.io, 'open')
+    def test_nic_speed_sysfs_fallback(
+        self, mock_io_open, mock_nl_query, mock_iface
+    ):
+        mock_nl_query.side_effect = OSError()
+        mock_iface.return_value.is_oper_up.return_value = True
+        for passed, expected in ((b'123', 123), (b'-10', 0), (b'', 0)):
+            mock_io_open.return_value = io.BytesIO(passed)
+
+            assert nic.speed('fake_nic') == expected
+
+    @mock.patch.object(nic, 'iface')
+    @mock.patch.object(nic, '_ethtool_nl_query')
+    def test_nic_speed_bulk(self, mock_nl_query, mock_iface):
+        mock_nl_query.return_value = {'nic0': 1000, 'nic1': 2 ** 32 - 1}
+        mock_iface.return_value.is_oper_up.return_value = True
+
+        speeds = nic.speed_bulk(['nic0', 'nic1', 'nic2'])
+
+        assert speeds == {'nic0': 1000, 'nic1': 0, 'nic2': 0}
+        mock_nl_query.assert_called_once_with(['nic0', 'nic1', 'nic2'])
+
     def test_dpdk_device_speed(self):
         assert nic.speed('dpdk0') == 0
 
@@ -251,6 +276,16 @@ class TestNetinfo(object):
         assert resulted_ifcfg['GATEWAY'] == gateway
         assert resulted_ifcfg['NETMASK'] == netmask
 
+    @mock.patch.object(misc, 'open', create=True)
+    def test_get_ifcfg_quoted_values_and_comments(self, mock_open):
+        ifcfg = '# comment\nNAME="System eth0"\nIPADDR0=1.1.1.2\n'
+        ifcfg_stream = six.StringIO(ifcfg)
+        mock_open.return_value.__enter__.return_value = ifcfg_stream
+
+        resulted_ifcfg = misc.getIfaceCfg('eth0')
+
+        assert resulted_ifcfg == {'NAME': 'System eth0', 'IPADDR': '1.1.1.2'}
+
     @mock.patch.object(misc, 'open', create=True)
     def test_missing_ifcfg_file(self, mock_open):
         mock_open.return_value.__enter__.side_effect = IOError()
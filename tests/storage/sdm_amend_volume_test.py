@@ -59,8 +59,7 @@ DEFAULT_SIZE = MiB
 
 
 @contextmanager
-def make_env(storage_type, fmt, chain_length=1,
-             size=DEFAULT_SIZE, sd_version=3, qcow2_compat='0.10'):
+def make_sd_env(storage_type, sd_version):
     with fake_env(storage_type, sd_version=sd_version) as env:
         rm = FakeResourceManager()
         with MonkeyPatchScope([
@@ -70,76 +69,85 @@ def make_env(storage_type, fmt, chain_length=1,
             (volume_info, 'sdCache', env.sdcache),
             (blockVolume, 'rm', rm),
         ]):
-            env.chain = make_qemu_chain(env, size, fmt, chain_length,
-                                        qcow2_compat=qcow2_compat)
             yield env
 
 
-@pytest.mark.parametrize("env_type", ["file", "block"])
-def test_amend(fake_scheduler, env_type):
-    fmt = sc.name2type('cow')
-    job_id = make_uuid()
-    with make_env(env_type, fmt, sd_version=4,
-                  qcow2_compat='0.10') as env:
-        env_vol = env.chain[0]
-        generation = env_vol.getMetaParam(sc.GENERATION)
-        assert env_vol.getQemuImageInfo()['compat'] == '0.10'
-        vol = dict(endpoint_type='div', sd_id=env_vol.sdUUID,
-                   img_id=env_vol.imgUUID, vol_id=env_vol.volUUID,
-                   generation=generation)
-        qcow2_attr = dict(compat='1.1')
-        job = amend_volume.Job(job_id, 0, vol, qcow2_attr)
-        job.run()
-        assert jobs.STATUS.DONE == job.status
-        assert env_vol.getQemuImageInfo()['compat'] == '1.1'
-        assert env_vol.getMetaParam(sc.GENERATION) == generation + 1
+@pytest.fixture(scope="module", params=["file", "block"])
+def sd_env(request):
+    """
+    Version 4 fake storage domain shared by all the module tests using the
+    same storage type.
+    """
+    with make_sd_env(request.param, sd_version=4) as env:
+        yield env
 
 
-@pytest.mark.parametrize("env_type", ["file", "block"])
-def test_vol_type_not_qcow(fake_scheduler, env_type):
-    fmt = sc.name2type('raw')
-    job_id = make_uuid()
-    with make_env(env_type, fmt, sd_version=4) as env:
-        env_vol = env.chain[0]
-        generation = env_vol.getMetaParam(sc.GENERATION)
-        vol = dict(endpoint_type='div', sd_id=env_vol.sdUUID,
-                   img_id=env_vol.imgUUID, vol_id=env_vol.volUUID,
-                   generation=generation)
-        qcow2_attr = dict(compat='1.1')
-        job = amend_volume.Job(job_id, 0, vol, qcow2_attr)
-        job.run()
-        assert job.status == jobs.STATUS.FAILED
-        assert type(job.error) == se.GeneralException
-        assert env_vol.getLegality() == sc.LEGAL_VOL
-        assert env_vol.getMetaParam(sc.GENERATION) == generation
+def make_chain(env, fmt, chain_length=1, size=DEFAULT_SIZE,
+               qcow2_compat='0.10'):
+    # Each chain is created in a new image, so tests sharing the storage
+    # domain do not affect each other.
+    return make_qemu_chain(env, size, fmt, chain_length,
+                           qcow2_compat=qcow2_compat)
 
 
-@pytest.mark.parametrize("env_type", ["file", "block"])
-def test_qemu_amend_failure(fake_scheduler, monkeypatch, env_type):
+def test_amend(fake_scheduler, sd_env):
+    fmt = sc.name2type('cow')
+    job_id = make_uuid()
+    env_vol = make_chain(sd_env, fmt, qcow2_compat='0.10')[0]
+    generation = env_vol.getMetaParam(sc.GENERATION)
+    assert env_vol.getQemuImageInfo()['compat'] == '0.10'
+    vol = dict(endpoint_type='div', sd_id=env_vol.sdUUID,
+               img_id=env_vol.imgUUID, vol_id=env_vol.volUUID,
+               generation=generation)
+    qcow2_attr = dict(compat='1.1')
+    job = amend_volume.Job(job_id, 0, vol, qcow2_attr)
+    job.run()
+    assert jobs.STATUS.DONE == job.status
+    assert env_vol.getQemuImageInfo()['compat'] == '1.1'
+    assert env_vol.getMetaParam(sc.GENERATION) == generation + 1
+
+
+def test_vol_type_not_qcow(fake_scheduler, sd_env):
+    fmt = sc.name2type('raw')
+    job_id = make_uuid()
+    env_vol = make_chain(sd_env, fmt)[0]
+    generation = env_vol.getMetaParam(sc.GENERATION)
+    vol = dict(endpoint_type='div', sd_id=env_vol.sdUUID,
+               img_id=env_vol.imgUUID, vol_id=env_vol.volUUID,
+               generation=generation)
+    qcow2_attr = dict(compat='1.1')
+    job = amend_volume.Job(job_id, 0, vol, qcow2_attr)
+    job.run()
+    assert job.status == jobs.STATUS.FAILED
+    assert type(job.error) == se.GeneralException
+    assert env_vol.getLegality() == sc.LEGAL_VOL
+    assert env_vol.getMetaParam(sc.GENERATION) == generation
+
+
+def test_qemu_amend_failure(fake_scheduler, monkeypatch, sd_env):
     monkeypatch.setattr(qemuimg, "amend", failure)
     fmt = sc.name2type('raw')
     job_id = make_uuid()
-    with make_env(env_type, fmt, sd_version=4) as env:
-        env_vol = env.chain[0]
-        generation = env_vol.getMetaParam(sc.GENERATION)
-        vol = dict(endpoint_type='div', sd_id=env_vol.sdUUID,
-                   img_id=env_vol.imgUUID, vol_id=env_vol.volUUID,
-                   generation=generation)
-        qcow2_attr = dict(compat='1.1')
-        job = amend_volume.Job(job_id, 0, vol, qcow2_attr)
-        job.run()
-        assert job.status == jobs.STATUS.FAILED
-        assert type(job.error) == se.GeneralException
-        assert env_vol.getLegality() == sc.LEGAL_VOL
-        assert env_vol.getMetaParam(sc.GENERATION) == generation
+    env_vol = make_chain(sd_env, fmt)[0]
+    generation = env_vol.getMetaParam(sc.GENERATION)
+    vol = dict(endpoint_type='div', sd_id=env_vol.sdUUID,
+               img_id=env_vol.imgUUID, vol_id=env_vol.volUUID,
+               generation=generation)
+    qcow2_attr = dict(compat='1.1')
+    job = amend_volume.Job(job_id, 0, vol, qcow2_attr)
+    job.run()
+    assert job.status == jobs.STATUS.FAILED
+    assert type(job.error) == se.GeneralException
+    assert env_vol.getLegality() == sc.LEGAL_VOL
+    assert env_vol.getMetaParam(sc.GENERATION) == generation
 
 
 @pytest.mark.parametrize("env_type", ["file", "block"])
 def test_sd_version_no_support_compat(fake_scheduler, env_type):
     fmt = sc.name2type('cow')
     job_id = make_uuid()
-    with make_env(env_type, fmt, sd_version=3) as env:
-        env_vol = env.chain[0]
+    with make_sd_env(env_type, sd_version=3) as env:
+        env_vol = make_chain(env, fmt)[0]
         generation = env_vol.getMetaParam(sc.GENERATION)
         vol = dict(endpoint_type='div', sd_id=env_vol.sdUUID,
                    img_id=env_vol.imgUUID, vol_id=env_vol.volUUID,